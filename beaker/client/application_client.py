@@ -163,7 +163,15 @@ class ApplicationClient:
 
         create_txid = create_result.tx_ids[0]
 
-        result = self.client.pending_transaction_info(create_txid)
+        # execute has already fetched the tx info for ABI method calls.
+        # Bare creates, or a failed fetch, still need the lookup.
+        if (
+            len(create_result.abi_results) > 0
+            and create_result.abi_results[0].tx_info is not None
+        ):
+            result = create_result.abi_results[0].tx_info
+        else:
+            result = self.client.pending_transaction_info(create_txid)
         app_id = result["application-index"]
         app_addr = get_application_address(app_id)
 
@@ -180,15 +188,43 @@ class ApplicationClient:
         suggested_params: transaction.SuggestedParams = None,
         **kwargs,
     ) -> str:
-
         """Submits a signed ApplicationCallTransaction with OnComplete set to UpdateApplication and source from the Application passed"""
+
+        atc = self.compose_update(
+            AtomicTransactionComposer(),
+            sender=sender,
+            signer=signer,
+            args=args,
+            suggested_params=suggested_params,
+            **kwargs,
+        )
+
+        try:
+            update_result = atc.execute(self.client, 4)
+        except Exception as e:
+            if "logic" in str(e):
+                raise self.wrap_approval_exception(e)
+            else:
+                raise e
+
+        return update_result.tx_ids[0]
+
+    def compose_update(
+        self,
+        atc: AtomicTransactionComposer,
+        sender: str = None,
+        signer: TransactionSigner = None,
+        args: list[Any] = None,
+        suggested_params: transaction.SuggestedParams = None,
+        **kwargs,
+    ) -> AtomicTransactionComposer:
+        """Adds an ApplicationCallTransaction with OnComplete set to UpdateApplication and source from the Application to the AtomicTransactionComposer passed"""
         self.build()
 
         sp = self.get_suggested_params(suggested_params)
         signer = self.get_signer(signer)
         sender = self.get_sender(sender, signer)
 
-        atc = AtomicTransactionComposer()
         if self.app.on_update is not None:
             self.add_method_call(
                 atc,
@@ -218,31 +254,52 @@ class ApplicationClient:
                 )
             )
 
+        return atc
+
+    def opt_in(
+        self,
+        sender: str = None,
+        signer: TransactionSigner = None,
+        args: list[Any] = None,
+        suggested_params: transaction.SuggestedParams = None,
+        **kwargs,
+    ) -> str:
+        """Submits a signed ApplicationCallTransaction with OnComplete set to OptIn"""
+
+        atc = self.compose_opt_in(
+            AtomicTransactionComposer(),
+            sender=sender,
+            signer=signer,
+            args=args,
+            suggested_params=suggested_params,
+            **kwargs,
+        )
+
         try:
-            update_result = atc.execute(self.client, 4)
+            opt_in_result = atc.execute(self.client, 4)
         except Exception as e:
             if "logic" in str(e):
                 raise self.wrap_approval_exception(e)
             else:
                 raise e
 
-        return update_result.tx_ids[0]
+        return opt_in_result.tx_ids[0]
 
-    def opt_in(
+    def compose_opt_in(
         self,
+        atc: AtomicTransactionComposer,
         sender: str = None,
         signer: TransactionSigner = None,
         args: list[Any] = None,
         suggested_params: transaction.SuggestedParams = None,
         **kwargs,
-    ) -> str:
-        """Submits a signed ApplicationCallTransaction with OnComplete set to OptIn"""
+    ) -> AtomicTransactionComposer:
+        """Adds an ApplicationCallTransaction with OnComplete set to OptIn to the AtomicTransactionComposer passed"""
 
         sp = self.get_suggested_params(suggested_params)
         signer = self.get_signer(signer)
         sender = self.get_sender(sender, signer)
 
-        atc = AtomicTransactionComposer()
         if self.app.on_opt_in is not None:
             self.add_method_call(
                 atc,
@@ -269,31 +326,52 @@ class ApplicationClient:
                 )
             )
 
+        return atc
+
+    def close_out(
+        self,
+        sender: str = None,
+        signer: TransactionSigner = None,
+        args: list[Any] = None,
+        suggested_params: transaction.SuggestedParams = None,
+        **kwargs,
+    ) -> str:
+        """Submits a signed ApplicationCallTransaction with OnComplete set to CloseOut"""
+
+        atc = self.compose_close_out(
+            AtomicTransactionComposer(),
+            sender=sender,
+            signer=signer,
+            args=args,
+            suggested_params=suggested_params,
+            **kwargs,
+        )
+
         try:
-            opt_in_result = atc.execute(self.client, 4)
+            close_out_result = atc.execute(self.client, 4)
         except Exception as e:
             if "logic" in str(e):
                 raise self.wrap_approval_exception(e)
             else:
                 raise e
 
-        return opt_in_result.tx_ids[0]
+        return close_out_result.tx_ids[0]
 
-    def close_out(
+    def compose_close_out(
         self,
+        atc: AtomicTransactionComposer,
         sender: str = None,
         signer: TransactionSigner = None,
         args: list[Any] = None,
         suggested_params: transaction.SuggestedParams = None,
         **kwargs,
-    ) -> str:
-        """Submits a signed ApplicationCallTransaction with OnComplete set to CloseOut"""
+    ) -> AtomicTransactionComposer:
+        """Adds an ApplicationCallTransaction with OnComplete set to CloseOut to the AtomicTransactionComposer passed"""
 
         sp = self.get_suggested_params(suggested_params)
         signer = self.get_signer(signer)
         sender = self.get_sender(sender, signer)
 
-        atc = AtomicTransactionComposer()
         if self.app.on_close_out is not None:
             self.add_method_call(
                 atc,
@@ -320,15 +398,7 @@ class ApplicationClient:
                 )
             )
 
-        try:
-            close_out_result = atc.execute(self.client, 4)
-        except Exception as e:
-            if "logic" in str(e):
-                raise self.wrap_approval_exception(e)
-            else:
-                raise e
-
-        return close_out_result.tx_ids[0]
+        return atc
 
     def clear_state(
         self,
@@ -338,14 +408,36 @@ class ApplicationClient:
         suggested_params: transaction.SuggestedParams = None,
         **kwargs,
     ) -> str:
-
         """Submits a signed ApplicationCallTransaction with OnComplete set to ClearState"""
 
+        atc = self.compose_clear_state(
+            AtomicTransactionComposer(),
+            sender=sender,
+            signer=signer,
+            args=args,
+            suggested_params=suggested_params,
+            **kwargs,
+        )
+
+        clear_state_result = atc.execute(self.client, 4)
+
+        return clear_state_result.tx_ids[0]
+
+    def compose_clear_state(
+        self,
+        atc: AtomicTransactionComposer,
+        sender: str = None,
+        signer: TransactionSigner = None,
+        args: list[Any] = None,
+        suggested_params: transaction.SuggestedParams = None,
+        **kwargs,
+    ) -> AtomicTransactionComposer:
+        """Adds an ApplicationCallTransaction with OnComplete set to ClearState to the AtomicTransactionComposer passed"""
+
         sp = self.get_suggested_params(suggested_params)
         signer = self.get_signer(signer)
         sender = self.get_sender(sender, signer)
 
-        atc = AtomicTransactionComposer()
         if self.app.on_clear_state is not None:
             self.add_method_call(
                 atc,
@@ -372,9 +464,7 @@ class ApplicationClient:
                 )
             )
 
-        clear_state_result = atc.execute(self.client, 4)
-
-        return clear_state_result.tx_ids[0]
+        return atc
 
     def delete(
         self,
@@ -386,11 +476,40 @@ class ApplicationClient:
     ) -> str:
         """Submits a signed ApplicationCallTransaction with OnComplete set to DeleteApplication"""
 
+        atc = self.compose_delete(
+            AtomicTransactionComposer(),
+            sender=sender,
+            signer=signer,
+            args=args,
+            suggested_params=suggested_params,
+            **kwargs,
+        )
+
+        try:
+            delete_result = atc.execute(self.client, 4)
+        except Exception as e:
+            if "logic" in str(e):
+                raise self.wrap_approval_exception(e)
+            else:
+                raise e
+
+        return delete_result.tx_ids[0]
+
+    def compose_delete(
+        self,
+        atc: AtomicTransactionComposer,
+        sender: str = None,
+        signer: TransactionSigner = None,
+        args: list[Any] = None,
+        suggested_params: transaction.SuggestedParams = None,
+        **kwargs,
+    ) -> AtomicTransactionComposer:
+        """Adds an ApplicationCallTransaction with OnComplete set to DeleteApplication to the AtomicTransactionComposer passed"""
+
         sp = self.get_suggested_params(suggested_params)
         signer = self.get_signer(signer)
         sender = self.get_sender(sender, signer)
 
-        atc = AtomicTransactionComposer()
         if self.app.on_delete:
             self.add_method_call(
                 atc,
@@ -416,15 +535,7 @@ class ApplicationClient:
                 )
             )
 
-        try:
-            delete_result = atc.execute(self.client, 4)
-        except Exception as e:
-            if "logic" in str(e):
-                raise self.wrap_approval_exception(e)
-            else:
-                raise e
-
-        return delete_result.tx_ids[0]
+        return atc
 
     def prepare(
         self, signer: TransactionSigner = None, sender: str = None, **kwargs
@@ -1,11 +1,17 @@
+import copy
 import pytest
 import pyteal as pt
-from typing import Any
+from typing import Any, Callable, Iterator
 from base64 import b64decode, b64encode
 
-from algosdk.account import generate_account
 from algosdk.logic import get_application_address
-from algosdk.future.transaction import Multisig, LogicSigAccount, OnComplete
+from algosdk.v2client.algod import AlgodClient
+from algosdk.future.transaction import (
+    Multisig,
+    LogicSigAccount,
+    OnComplete,
+    SuggestedParams,
+)
 from algosdk.atomic_transaction_composer import (
     AtomicTransactionComposer,
     AccountTransactionSigner,
@@ -24,13 +30,17 @@ from ..decorators import (
     delete,
     opt_in,
 )
-from beaker.sandbox import get_accounts, get_algod_client
+from beaker.sandbox import get_algod_client
 from beaker.application import Application, get_method_selector
 from beaker.state import ApplicationStateValue, AccountStateValue
 from beaker.client.application_client import ApplicationClient
 from beaker.client.logic_error import LogicException
 
 
+# Shared by the handlers below rather than building a new expression in each
+_APPROVE = pt.Approve()
+
+
 class App(Application):
     app_state_val_int = ApplicationStateValue(pt.TealType.uint64, default=pt.Int(1))
     app_state_val_byte = ApplicationStateValue(
@@ -44,32 +54,32 @@ class App(Application):
         return pt.Seq(
             self.initialize_application_state(),
             pt.Assert(pt.Len(pt.Txn.note()) == pt.Int(0)),
-            pt.Approve(),
+            _APPROVE,
         )
 
     @update(authorize=Authorize.only(pt.Global.creator_address()))
     def update(self):
-        return pt.Approve()
+        return _APPROVE
 
     @delete(authorize=Authorize.only(pt.Global.creator_address()))
     def delete(self):
-        return pt.Approve()
+        return _APPROVE
 
     @opt_in
     def opt_in(self):
         return pt.Seq(
             self.initialize_account_state(),
             pt.Assert(pt.Len(pt.Txn.note()) == pt.Int(0)),
-            pt.Approve(),
+            _APPROVE,
         )
 
     @clear_state
     def clear_state(self):
-        return pt.Seq(pt.Assert(pt.Len(pt.Txn.note()) == pt.Int(0)), pt.Approve())
+        return pt.Seq(pt.Assert(pt.Len(pt.Txn.note()) == pt.Int(0)), _APPROVE)
 
     @close_out
     def close_out(self):
-        return pt.Seq(pt.Assert(pt.Len(pt.Txn.note()) == pt.Int(0)), pt.Approve())
+        return pt.Seq(pt.Assert(pt.Len(pt.Txn.note()) == pt.Int(0)), _APPROVE)
 
     @external
     def add(self, a: pt.abi.Uint64, b: pt.abi.Uint64, *, output: pt.abi.Uint64):
@@ -80,18 +90,67 @@ class App(Application):
         return output.set("deadbeef")
 
 
+class ABICreateApp(Application):
+    stored_val = ApplicationStateValue(pt.TealType.uint64)
+
+    @create
+    def create(self, val: pt.abi.Uint64):
+        return self.stored_val.set(val.get())
+
+
+# pragma version 6; int 1; return
+_APPROVE_PROGRAM = b64decode("BoEBQw==")
+
 SandboxAccounts = list[tuple[str, str, AccountTransactionSigner]]
+GeneratedAccounts = list[tuple[str, str]]
 
 
 @pytest.fixture(scope="session")
-def sb_accts() -> SandboxAccounts:
-    return [(acct.address, acct.private_key, acct.signer) for acct in get_accounts()]
+def app() -> App:
+    return App()
 
 
-def test_app_client_create():
-    app = App()
-    client = get_algod_client()
-    ac = ApplicationClient(client, app)
+@pytest.fixture(scope="session")
+def lsig_signer() -> LogicSigTransactionSigner:
+    return LogicSigTransactionSigner(LogicSigAccount(_APPROVE_PROGRAM))
+
+
+@pytest.fixture(scope="session")
+def created_app(
+    app: App,
+    client: AlgodClient,
+    accounts: SandboxAccounts,
+    new_sp: Callable[[], SuggestedParams],
+) -> ApplicationClient:
+    """an app created once and shared by tests that leave it usable
+
+    Every test using it is in the "created_app" xdist group so under
+    `--dist loadgroup` a single worker creates it and runs them serially,
+    they share sandbox accounts so must not run concurrently anyway
+    """
+    _, _, signer = accounts[0]
+    ac = ApplicationClient(client, app, signer=signer, suggested_params=new_sp())
+    ac.create()
+    return ac
+
+
+@pytest.fixture
+def fresh_app(
+    app: App,
+    client: AlgodClient,
+    accounts: SandboxAccounts,
+    new_sp: Callable[[], SuggestedParams],
+) -> ApplicationClient:
+    """a newly created app for tests that destroy it"""
+    _, _, signer = accounts[0]
+    ac = ApplicationClient(client, app, signer=signer, suggested_params=new_sp())
+    ac.create()
+    return ac
+
+
+def test_app_client_create(app: App):
+    # No network calls here, so skip the probing client fixture
+    ac = ApplicationClient(get_algod_client(), app)
     assert ac.signer is None, "Should not have a signer"
     assert ac.sender is None, "Should not have a sender"
     assert ac.app_id == 0, "Should not have app id"
@@ -105,11 +164,14 @@ def test_app_client_create():
         ac.get_sender(None, None)
 
 
-def test_app_prepare(sb_accts: SandboxAccounts):
-    app = App()
-    client = get_algod_client()
-
-    (addr, sk, signer) = sb_accts[0]
+def test_app_prepare(
+    app: App,
+    client: AlgodClient,
+    accts: SandboxAccounts,
+    extra_accounts: GeneratedAccounts,
+    lsig_signer: LogicSigTransactionSigner,
+):
+    (addr, sk, signer) = accts[0]
 
     ac_with_signer = ApplicationClient(client, app, signer=signer)
 
@@ -120,7 +182,7 @@ def test_app_prepare(sb_accts: SandboxAccounts):
         ac_with_signer.get_sender(None, None) == addr
     ), "Should produce the same address"
 
-    new_pk, new_addr = generate_account()
+    new_pk, new_addr = extra_accounts[0]
     new_signer = AccountTransactionSigner(new_pk)
     ac_with_signer_and_sender = ac_with_signer.prepare(sender=new_addr)
 
@@ -146,9 +208,9 @@ def test_app_prepare(sb_accts: SandboxAccounts):
         ac_with_signer_and_sender.get_sender(None, new_signer) == new_addr
     ), "Should be new address"
 
-    accts = [generate_account() for _ in range(3)]
-    addrs = [acct[1] for acct in accts]
-    sks = [acct[0] for acct in accts]
+    msig_accts = extra_accounts[1:4]
+    addrs = [acct[1] for acct in msig_accts]
+    sks = [acct[0] for acct in msig_accts]
 
     msig_acct = Multisig(1, 3, addrs)
     msts = MultisigTransactionSigner(msig_acct, sks[0])
@@ -163,10 +225,7 @@ def test_app_prepare(sb_accts: SandboxAccounts):
         ac_with_msig.get_sender(None, None) == msig_acct.address()
     ), "Should produce the same address"
 
-    # pragma version 6; int 1; return
-    program = b64decode("BoEBQw==")
-    lsig = LogicSigAccount(program)
-    lsig_signer = LogicSigTransactionSigner(lsig)
+    lsig = lsig_signer.lsig
 
     ac_with_lsig = ac_with_signer.prepare(signer=lsig_signer)
     assert ac_with_lsig.signer == lsig_signer, "Should have the same signer"
@@ -189,14 +248,15 @@ def test_app_prepare(sb_accts: SandboxAccounts):
     ), "We should have overwritten the app id in the new version"
 
 
-def test_compile():
+def test_compile(client: AlgodClient):
     version = 5
     app = App(version=version)
-    client = get_algod_client()
     ac = ApplicationClient(client, app)
 
     # TODO add precompiles
 
+    assert ac.app.approval_program is not None and ac.app.clear_program is not None
+
     approval_program, _, approval_map = ac.compile(
         ac.app.approval_program, source_map=True
     )
@@ -214,21 +274,55 @@ def test_compile():
 
 
 def expect_dict(actual: dict[str, Any], expected: dict[str, Any]):
-    for k, v in expected.items():
-        if type(v) is dict:
-            expect_dict(actual[k], v)
-        else:
-            assert actual[k] == v, f"for field {k}, expected {v} got {actual[k]}"
-
-
-def test_create(sb_accts: SandboxAccounts):
-    app = App()
-
-    addr, pk, signer = sb_accts[0]
-
-    client = get_algod_client()
-    ac = ApplicationClient(client, app, signer=signer)
-    app_id, app_addr, tx_id = ac.create()
+    # Walk nested dicts with an explicit stack rather than recursing
+    stack = [(actual, expected)]
+    while stack:
+        act, exp = stack.pop()
+        for k, v in exp.items():
+            if type(v) is dict:
+                stack.append((act[k], v))
+            else:
+                assert act[k] == v, f"for field {k}, expected {v} got {act[k]}"
+
+
+@pytest.mark.parametrize(
+    "extra_pages,override_fee,signer_idx", [(None, False, 0), (2, True, 1)]
+)
+def test_create(
+    app: App,
+    client: AlgodClient,
+    accts: SandboxAccounts,
+    sp: SuggestedParams,
+    extra_pages: int | None,
+    override_fee: bool,
+    signer_idx: int,
+):
+    _, _, signer = accts[0]
+    addr, _, new_signer = accts[signer_idx]
+
+    # Create through a prepared copy, possibly with another account's signer
+    base_ac = ApplicationClient(client, app, signer=signer, suggested_params=sp)
+    ac = base_ac.prepare(signer=new_signer)
+
+    expected_txn: dict[str, Any] = {
+        "snd": addr,
+        "apgs": {"nbs": 1, "nui": 1},
+        "apls": {"nbs": 1, "nui": 1},
+    }
+
+    create_sp = None
+    if override_fee:
+        create_sp = copy.copy(sp)
+        create_sp.fee = 1_000_000
+        create_sp.flat_fee = True
+        expected_txn["fee"] = create_sp.fee
+
+    if extra_pages:
+        expected_txn["apep"] = extra_pages
+
+    app_id, app_addr, tx_id = ac.create(
+        extra_pages=extra_pages, suggested_params=create_sp
+    )
     assert app_id > 0
     assert app_addr == get_application_address(app_id)
     assert ac.app_id == app_id
@@ -241,29 +335,22 @@ def test_create(sb_accts: SandboxAccounts):
         {
             "application-index": app_id,
             "pool-error": "",
-            "txn": {
-                "txn": {
-                    "snd": addr,
-                    "apgs": {"nbs": 1, "nui": 1},
-                    "apls": {"nbs": 1, "nui": 1},
-                }
-            },
+            "txn": {"txn": expected_txn},
         },
     )
 
-    new_addr, new_pk, new_signer = sb_accts[1]
-    new_ac = ac.prepare(signer=new_signer)
-    extra_pages = 2
-    sp = client.suggested_params()
-    sp.fee = 1_000_000
-    sp.flat_fee = True
-    app_id, app_addr, tx_id = new_ac.create(
-        extra_pages=extra_pages, suggested_params=sp
-    )
+
+def test_create_abi_method(
+    client: AlgodClient, accts: SandboxAccounts, sp: SuggestedParams
+):
+    addr, _, signer = accts[0]
+
+    app = ABICreateApp()
+    ac = ApplicationClient(client, app, signer=signer, suggested_params=sp)
+    app_id, app_addr, tx_id = ac.create(val=42)
     assert app_id > 0
     assert app_addr == get_application_address(app_id)
-    assert new_ac.app_id == app_id
-    assert new_ac.app_addr == app_addr
+    assert ac.app_id == app_id
 
     result_tx = client.pending_transaction_info(tx_id)
     expect_dict(
@@ -273,189 +360,151 @@ def test_create(sb_accts: SandboxAccounts):
             "pool-error": "",
             "txn": {
                 "txn": {
-                    "snd": new_addr,
-                    "apep": extra_pages,
-                    "fee": sp.fee,
-                    "apgs": {"nbs": 1, "nui": 1},
-                    "apls": {"nbs": 1, "nui": 1},
-                }
-            },
-        },
-    )
-
-    with pytest.raises(LogicException):
-        ac.create(note="failmeplz")
-
-
-def test_update(sb_accts: SandboxAccounts):
-    app = App()
-
-    addr, pk, signer = sb_accts[0]
-
-    client = get_algod_client()
-    ac = ApplicationClient(client, app, signer=signer)
-    app_id, app_addr, _ = ac.create()
-
-    tx_id = ac.update()
-    result_tx = client.pending_transaction_info(tx_id)
-    expect_dict(
-        result_tx,
-        {
-            "pool-error": "",
-            "txn": {
-                "txn": {
-                    "apan": OnComplete.UpdateApplicationOC,
-                    "apid": app_id,
                     "snd": addr,
+                    "apaa": [
+                        b64encode(get_method_selector(app.create)).decode("utf-8"),
+                        b64encode((42).to_bytes(8, "big")).decode("utf-8"),
+                    ],
                 }
             },
         },
     )
 
-    with pytest.raises(LogicException):
-        addr, pk, signer2 = sb_accts[1]
-        ac2 = ac.prepare(signer=signer2)
-        ac2.update()
-
-
-def test_delete(sb_accts: SandboxAccounts):
-    app = App()
-    addr, pk, signer = sb_accts[0]
+    assert ac.get_application_state() == {"stored_val": 42}
 
-    client = get_algod_client()
-    ac = ApplicationClient(client, app, signer=signer)
-    app_id, _, _ = ac.create()
-
-    tx_id = ac.delete()
-    result_tx = client.pending_transaction_info(tx_id)
-    expect_dict(
-        result_tx,
-        {
-            "pool-error": "",
-            "txn": {
-                "txn": {
-                    "apan": OnComplete.DeleteApplicationOC,
-                    "apid": app_id,
-                    "snd": addr,
-                }
-            },
-        },
-    )
 
+def test_create_rejected(
+    app: App, client: AlgodClient, accts: SandboxAccounts, sp: SuggestedParams
+):
+    _, _, signer = accts[0]
+    ac = ApplicationClient(client, app, signer=signer, suggested_params=sp)
     with pytest.raises(LogicException):
-        ac = ApplicationClient(client, app, signer=signer)
-        app_id, _, _ = ac.create()
-
-        _, _, signer2 = sb_accts[1]
-        ac2 = ac.prepare(signer=signer2)
-        ac2.delete()
-
-
-def test_opt_in(sb_accts: SandboxAccounts):
-    app = App()
-
-    addr, pk, signer = sb_accts[0]
+        ac.create(note="failmeplz")
 
-    client = get_algod_client()
-    ac = ApplicationClient(client, app, signer=signer)
-    app_id, _, _ = ac.create()
 
-    new_addr, new_pk, new_signer = sb_accts[1]
-    new_ac = ac.prepare(signer=new_signer)
-    tx_id = new_ac.opt_in()
-    result_tx = client.pending_transaction_info(tx_id)
-    expect_dict(
-        result_tx,
-        {
-            "pool-error": "",
-            "txn": {
-                "txn": {
-                    "apan": OnComplete.OptInOC,
-                    "apid": app_id,
-                    "snd": new_addr,
-                }
-            },
-        },
+def is_opted_in(ac: ApplicationClient) -> bool:
+    """checks whether the client's sender has local state for the client's app"""
+    acct_info = ac.client.account_info(ac.get_sender())
+    return any(
+        local_state["id"] == ac.app_id
+        for local_state in acct_info.get("apps-local-state", [])
     )
 
-    with pytest.raises(LogicException):
-        _, _, newer_signer = sb_accts[2]
-        newer_ac = ac.prepare(signer=newer_signer)
-        newer_ac.opt_in(note="failmeplz")
-
-
-def test_close_out(sb_accts: SandboxAccounts):
 
-    app = App()
-
-    addr, pk, signer = sb_accts[0]
-
-    client = get_algod_client()
-    ac = ApplicationClient(client, app, signer=signer)
-    app_id, _, _ = ac.create()
-
-    new_addr, new_pk, new_signer = sb_accts[1]
-    new_ac = ac.prepare(signer=new_signer)
-    new_ac.opt_in()
-
-    tx_id = new_ac.close_out()
-    result_tx = client.pending_transaction_info(tx_id)
-    expect_dict(
-        result_tx,
-        {
-            "pool-error": "",
-            "txn": {
-                "txn": {
-                    "apan": OnComplete.CloseOutOC,
-                    "apid": app_id,
-                    "snd": new_addr,
-                }
-            },
-        },
+@pytest.fixture
+def on_complete_app(
+    request: pytest.FixtureRequest,
+    method: str,
+    created_app: ApplicationClient,
+    accts: SandboxAccounts,
+    sp: SuggestedParams,
+) -> Iterator[ApplicationClient]:
+    """a client prepared to send the OnComplete method under test
+
+    Update and delete are sent by the creator, delete against a fresh app since it destroys it.
+    The local state methods are sent by another account.
+    """
+    if method in ("update", "delete"):
+        _, _, signer = accts[0]
+    else:
+        _, _, signer = accts[1]
+
+    app_client = (
+        request.getfixturevalue("fresh_app") if method == "delete" else created_app
     )
+    ac = app_client.prepare(signer=signer, suggested_params=sp)
+
+    try:
+        yield ac
+    finally:
+        # Leave the shared app without local state for this account
+        if is_opted_in(ac):
+            ac.clear_state()
+
+
+@pytest.mark.xdist_group("created_app")
+@pytest.mark.parametrize(
+    "method,oc",
+    [
+        ("update", OnComplete.UpdateApplicationOC),
+        ("opt_in", OnComplete.OptInOC),
+        ("close_out", OnComplete.CloseOutOC),
+        ("clear_state", OnComplete.ClearStateOC),
+        ("delete", OnComplete.DeleteApplicationOC),
+    ],
+)
+def test_on_complete(on_complete_app: ApplicationClient, method: str, oc: OnComplete):
+    ac = on_complete_app
 
-    with pytest.raises(LogicException):
-        _, _, newer_signer = sb_accts[2]
-        newer_ac = ac.prepare(signer=newer_signer)
-        newer_ac.opt_in()
-        newer_ac.close_out(note="failmeplz")
-
-
-def test_clear_state(sb_accts: SandboxAccounts):
-    app = App()
-    addr, pk, signer = sb_accts[0]
-
-    client = get_algod_client()
-    ac = ApplicationClient(client, app, signer=signer)
-    app_id, _, _ = ac.create()
-
-    new_addr, new_pk, new_signer = sb_accts[1]
-    new_ac = ac.prepare(signer=new_signer)
-    new_ac.opt_in()
-
-    tx_id = new_ac.clear_state()
-    result_tx = client.pending_transaction_info(tx_id)
-    expect_dict(
-        result_tx,
-        {
-            "pool-error": "",
-            "txn": {
+    atc = AtomicTransactionComposer()
+    expected_ocs = []
+    if method in ("close_out", "clear_state"):
+        # Opt in within the same group so there is local state to remove
+        ac.compose_opt_in(atc)
+        expected_ocs.append(OnComplete.OptInOC)
+
+    getattr(ac, f"compose_{method}")(atc)
+    expected_ocs.append(oc)
+
+    atc_result = atc.execute(ac.client, 4)
+
+    # execute has already waited for the group to be confirmed
+    for tx_id, expected_oc in zip(atc_result.tx_ids, expected_ocs):
+        expect_dict(
+            ac.client.pending_transaction_info(tx_id),
+            {
+                "pool-error": "",
                 "txn": {
-                    "apan": OnComplete.ClearStateOC,
-                    "apid": app_id,
-                    "snd": new_addr,
-                }
+                    "txn": {
+                        "apan": expected_oc,
+                        "apid": ac.app_id,
+                        "snd": ac.sender,
+                    }
+                },
             },
-        },
-    )
-
+        )
 
-def test_call(sb_accts: SandboxAccounts):
-    app = App()
-    addr, pk, signer = sb_accts[0]
 
-    client = get_algod_client()
-    ac = ApplicationClient(client, app, signer=signer)
+@pytest.mark.xdist_group("created_app")
+@pytest.mark.parametrize(
+    "method,kwargs",
+    [
+        ("update", {}),
+        ("delete", {}),
+        ("opt_in", {"note": "failmeplz"}),
+        ("close_out", {"note": "failmeplz"}),
+    ],
+)
+def test_on_complete_rejected(
+    created_app: ApplicationClient,
+    accts: SandboxAccounts,
+    sp: SuggestedParams,
+    method: str,
+    kwargs: dict[str, Any],
+):
+    # Update and delete are only authorized for the creator,
+    # the others fail when a note is passed
+    _, _, signer = accts[2]
+    ac = created_app.prepare(signer=signer, suggested_params=sp)
+
+    try:
+        if method == "close_out":
+            ac.opt_in()
+
+        with pytest.raises(LogicException):
+            getattr(ac, method)(**kwargs)
+    finally:
+        # Leave the shared app without local state for this account
+        if is_opted_in(ac):
+            ac.clear_state()
+
+
+def test_call(
+    app: App, client: AlgodClient, accts: SandboxAccounts, sp: SuggestedParams
+):
+    addr, pk, signer = accts[0]
+
+    ac = ApplicationClient(client, app, signer=signer, suggested_params=sp)
     app_id, _, _ = ac.create()
 
     result = ac.call(app.add, a=1, b=1)
@@ -488,13 +537,12 @@ def test_call(sb_accts: SandboxAccounts):
     )
 
 
-def test_add_method_call(sb_accts: SandboxAccounts):
-    app = App()
-
-    addr, pk, signer = sb_accts[0]
+def test_add_method_call(
+    app: App, client: AlgodClient, accts: SandboxAccounts, sp: SuggestedParams
+):
+    addr, pk, signer = accts[0]
 
-    client = get_algod_client()
-    ac = ApplicationClient(client, app, signer=signer)
+    ac = ApplicationClient(client, app, signer=signer, suggested_params=sp)
     app_id, _, _ = ac.create()
 
     atc = AtomicTransactionComposer()
@@ -531,14 +579,14 @@ def test_add_method_call(sb_accts: SandboxAccounts):
     )
 
 
-def test_fund(sb_accts: SandboxAccounts):
-    app = App()
-    addr, pk, signer = sb_accts[0]
-    client = get_algod_client()
+def test_fund(
+    app: App, client: AlgodClient, accts: SandboxAccounts, sp: SuggestedParams
+):
+    addr, pk, signer = accts[0]
 
     fund_amt = 1_000_000
 
-    ac = ApplicationClient(client, app, signer=signer)
+    ac = ApplicationClient(client, app, signer=signer, suggested_params=sp)
     ac.create()
     ac.fund(fund_amt)
 
@@ -546,14 +594,12 @@ def test_fund(sb_accts: SandboxAccounts):
     assert info["amount"] == fund_amt, "Expected balance to equal fund_amt"
 
 
-def test_resolve(sb_accts: SandboxAccounts):
-
-    app = App()
-
-    addr, pk, signer = sb_accts[0]
+def test_resolve(
+    app: App, client: AlgodClient, accts: SandboxAccounts, sp: SuggestedParams
+):
+    addr, pk, signer = accts[0]
 
-    client = get_algod_client()
-    ac = ApplicationClient(client, app, signer=signer)
+    ac = ApplicationClient(client, app, signer=signer, suggested_params=sp)
 
     ac.create()
     ac.opt_in()
@@ -0,0 +1,114 @@
+import copy
+import itertools
+import os
+import pytest
+from typing import Callable
+
+from algosdk.account import generate_account
+from algosdk.atomic_transaction_composer import AccountTransactionSigner
+from algosdk.future.transaction import SuggestedParams
+from algosdk.v2client.algod import AlgodClient
+
+from beaker.sandbox import get_accounts, get_algod_client
+from beaker.client.application_client import ApplicationClient
+
+SandboxAccounts = list[tuple[str, str, AccountTransactionSigner]]
+GeneratedAccounts = list[tuple[str, str]]
+
+
+def pytest_configure(config: pytest.Config):
+    # pytest-xdist registers this too, declare it so runs without xdist don't warn
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run tests sharing on-chain state on one worker"
+    )
+
+
+@pytest.fixture(scope="session", autouse=True)
+def cached_build():
+    """reuses the compiled programs across ApplicationClients built for the same App class and version"""
+
+    build = ApplicationClient.build
+    compiled: dict[tuple[type, int], tuple] = {}
+
+    def _build(self: ApplicationClient):
+        # Precompiles may change the programs, always build those
+        if len(self.app.precompiles) > 0:
+            return build(self)
+
+        key = (type(self.app), self.app.teal_version)
+        if key not in compiled:
+            build(self)
+            compiled[key] = (
+                self.approval_binary,
+                self.approval_src_map,
+                self.clear_binary,
+                self.clear_src_map,
+            )
+
+        (
+            self.approval_binary,
+            self.approval_src_map,
+            self.clear_binary,
+            self.clear_src_map,
+        ) = compiled[key]
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(ApplicationClient, "build", _build)
+        yield
+
+
+@pytest.fixture(scope="session")
+def client() -> AlgodClient:
+    """the sandbox algod client, skipping the tests that need it if it can't be reached"""
+    client = get_algod_client()
+    try:
+        client.status()
+    except Exception as e:
+        pytest.skip(f"sandbox algod unreachable: {e}")
+    return client
+
+
+@pytest.fixture(scope="session")
+def new_sp(client: AlgodClient) -> Callable[[], SuggestedParams]:
+    """returns copies of suggested params fetched once for the session
+
+    Each copy has a distinct last valid round so otherwise identical transactions
+    sent from different tests don't end up with the same transaction id.
+    With pytest-xdist each worker draws from its own interleaved set of offsets.
+    """
+    base_sp = client.suggested_params()
+
+    # Set by pytest-xdist on its workers, absent otherwise
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+    worker_count = int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", "1"))
+    offsets = itertools.count(int(worker_id.removeprefix("gw")), worker_count)
+
+    def _new_sp() -> SuggestedParams:
+        sp = copy.copy(base_sp)
+        sp.last -= next(offsets)
+        return sp
+
+    return _new_sp
+
+
+@pytest.fixture
+def sp(new_sp: Callable[[], SuggestedParams]) -> SuggestedParams:
+    return new_sp()
+
+
+@pytest.fixture(scope="session")
+def accounts(client: AlgodClient) -> SandboxAccounts:
+    # Depends on client so an unreachable sandbox skips rather than erroring on kmd
+    return [(acct.address, acct.private_key, acct.signer) for acct in get_accounts()]
+
+
+@pytest.fixture
+def accts(accounts: SandboxAccounts) -> SandboxAccounts:
+    # copy so tests that pop/mutate don't affect the session list
+    return list(accounts)
+
+
+@pytest.fixture(scope="session")
+def extra_accounts() -> GeneratedAccounts:
+    """(private_key, address) pairs generated once for the session, index into it rather than mutating"""
+    return [generate_account() for _ in range(4)]
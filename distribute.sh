@@ -1,6 +1,6 @@
 #!/bin/bash
 
-# Make sure the version in setup.py is updated
+# Make sure the version in pyproject.toml is updated
 
 echo "Removing previous builds"
 rm dist/*